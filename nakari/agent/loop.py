@@ -3,16 +3,28 @@
 Implements the ReAct (Reasoning + Acting) pattern with tool execution.
 """
 
-import json
-from dataclasses import dataclass
-from datetime import date, time, datetime
+import asyncio
+import random
+import sys
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    BadRequestError,
+    InternalServerError,
+    NotFoundError,
+    RateLimitError,
+)
 from openai.types.chat import ChatCompletionMessageParam
 
 from .prompt import SYSTEM_PROMPT
-from .tools import get_memory_tools
+from .tools import get_memory_tools, get_responses_tools
 from ..memory import MemoryClient
 from ..search import SearchClient, SearchOptions
 
@@ -20,39 +32,175 @@ from ..search import SearchClient, SearchOptions
 # Maximum number of ReAct iterations
 MAX_ITERATIONS: int = 10
 
+# System message shared across turns - built once so the prompt string is not
+# re-wrapped in a fresh dict per call. Must never be mutated.
+_SYSTEM_MESSAGE: ChatCompletionMessageParam = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Appended when the loop runs out of iterations
+_MAX_ITERATIONS_MESSAGE: ChatCompletionMessageParam = {
+    "role": "system",
+    "content": (
+        "You have reached the maximum number of iterations. "
+        "Please provide your final response to the user now."
+    ),
+}
+
+# Appended when every tool call has failed for several iterations in a row
+_ERROR_STREAK_MESSAGE: ChatCompletionMessageParam = {
+    "role": "system",
+    "content": (
+        "Your tools are failing repeatedly and further attempts are unlikely "
+        "to succeed. Explain the problem to the user in your final response now."
+    ),
+}
+
+
+def _all_errors(results: list[dict[str, Any]]) -> bool:
+    """Return True if every tool result in the iteration is an error."""
+    return bool(results) and all(
+        isinstance(result, dict) and set(result) == {"error"} for result in results
+    )
+
 
-def _json_serializable(obj: Any) -> Any:
-    """Convert an object to a JSON-serializable format."""
-    # None, bool, int, float, str are already JSON-serializable
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
+def _orjson_default(obj: Any) -> Any:
+    """Fallback serializer for types orjson cannot encode natively.
 
+    orjson handles dicts, lists, tuples, and datetime objects in C, so this
+    only needs to cover the exotic cases from Neo4j results.
+    """
     # Handle Neo4j Record-like objects
-    if hasattr(obj, "__class__") and obj.__class__.__name__ == "Record":
-        return {k: _json_serializable(v) for k, v in obj.items()}
+    if obj.__class__.__name__ == "Record":
+        return dict(obj)
 
-    # Handle Neo4j Date/time objects
-    if hasattr(obj, "__class__") and "neo4j" in getattr(obj.__class__, "__module__", ""):
-        return str(obj)
+    # Handle Neo4j Date/time and other driver objects
+    # For anything else, fall back to string as well
+    return str(obj)
 
-    # Handle standard datetime objects
-    if isinstance(obj, (date, time, datetime)):
-        return obj.isoformat()
 
-    # Handle dicts recursively
-    if isinstance(obj, dict):
-        return {k: _json_serializable(v) for k, v in obj.items()}
+def _dump_result(result: Any) -> str:
+    """Serialize a tool result to a JSON string for the LLM."""
+    return orjson.dumps(
+        result, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
 
-    # Handle lists recursively
-    if isinstance(obj, list):
-        return [_json_serializable(v) for v in obj]
 
-    # Handle tuples (convert to list)
-    if isinstance(obj, tuple):
-        return [_json_serializable(v) for v in obj]
+# Character budget for a single tool result in the prompt. Every appended
+# result is re-sent to the model on each subsequent iteration, so oversized
+# observations make prompt-token cost grow quadratically with loop length.
+_MAX_RESULT_CHARS: int = 4000
 
-    # For anything else, try to convert to string
-    return str(obj)
+
+def _compact_tool_result(name: str, result: Any, max_chars: int = _MAX_RESULT_CHARS) -> str:
+    """Serialize a tool result for the LLM, truncating oversized payloads.
+
+    memory_schema results are always kept whole. For query and search
+    results, rows are dropped from the end until the serialized form fits
+    the budget, with a note about how many were omitted. The full result is
+    still emitted to on_step for local observability.
+
+    Args:
+        name: Tool name the result came from
+        result: Tool result
+        max_chars: Maximum serialized length to send to the LLM
+
+    Returns:
+        JSON string, possibly truncated
+    """
+    content = _dump_result(result)
+    if name == "memory_schema" or len(content) <= max_chars:
+        return content
+
+    # Drop trailing rows/results until the payload fits
+    if isinstance(result, dict):
+        for key in ("records", "results"):
+            items = result.get(key)
+            if isinstance(items, list) and len(items) > 1:
+                kept = len(items)
+                while kept > 1 and len(content) > max_chars:
+                    kept //= 2
+                    compact = {
+                        **result,
+                        key: items[:kept],
+                        "truncated": f"... ({len(items) - kept} more {key} omitted)",
+                    }
+                    content = _dump_result(compact)
+                if len(content) <= max_chars:
+                    return content
+                # A single kept row still blows the budget - fall through
+                # to the hard truncation so the cap always holds
+                break
+
+    # No shrinkable list, or shrinking wasn't enough - hard-truncate
+    return content[:max_chars] + "... (truncated)"
+
+
+# Defaults for outbound OpenAI call pacing
+_DEFAULT_REQUESTS_PER_MINUTE: int = 300
+_RETRY_ATTEMPTS: int = 5
+_RETRY_BASE_DELAY: float = 0.5
+_RETRY_MAX_DELAY: float = 8.0
+
+
+class RateLimiter:
+    """Sliding-window rate limiter for outbound API calls.
+
+    Proactively paces requests instead of waiting for the provider to
+    return 429s - important now that parallel tool dispatch can burst
+    several calls at once.
+    """
+
+    def __init__(self, max_calls: int, period: float = 60.0) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_calls: Maximum calls allowed per period
+            period: Window length in seconds
+        """
+        self._max_calls = max_calls
+        self._period = period
+        self._timestamps: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call slot is available within the window."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self._period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self._max_calls:
+                    self._timestamps.append(now)
+                    return
+                wait = self._period - (now - self._timestamps[0])
+            await asyncio.sleep(wait)
+
+
+async def _call_openai(
+    options: "LoopOptions",
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Invoke an OpenAI endpoint with throttling and bounded retries.
+
+    Transient failures (rate limits, connection errors, 5xx) are retried
+    with exponential backoff; jitter decorrelates parallel calls that
+    would otherwise retry in lockstep.
+
+    Args:
+        options: Loop options carrying the rate limiter
+        factory: Zero-argument callable issuing the API request
+
+    Returns:
+        The API response
+    """
+    for attempt in range(_RETRY_ATTEMPTS):
+        await options.throttle.acquire()
+        try:
+            return await factory()
+        except (RateLimitError, APIConnectionError, InternalServerError):
+            if attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(_RETRY_BASE_DELAY * (2 ** attempt), _RETRY_MAX_DELAY)
+            await asyncio.sleep(delay * (0.5 + random.random()))
 
 
 @dataclass(frozen=True)
@@ -64,34 +212,98 @@ class LoopOptions:
     memory: MemoryClient
     search: SearchClient | None = None
     embedding_model: str | None = None
-    on_step: Callable[["LoopStep"], None] | None = None
-
+    on_step: Callable[["LoopStep"], None | Awaitable[None]] | None = None
+    use_responses_api: bool = True
+    max_error_streak: int = 2
+    throttle: RateLimiter = field(
+        default_factory=lambda: RateLimiter(_DEFAULT_REQUESTS_PER_MINUTE)
+    )
 
-class LoopStep:
-    """A single step in the ReAct loop."""
-
-    def __init__(
-        self,
-        step_type: str,
-        content: str = "",
-        name: str = "",
-        arguments: dict[str, Any] | None = None,
-        result: Any = None,
-    ) -> None:
-        """Initialize a loop step.
+    @classmethod
+    def build(
+        cls,
+        *,
+        model: str,
+        memory: MemoryClient,
+        openai: AsyncOpenAI | None = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        search: SearchClient | None = None,
+        embedding_model: str | None = None,
+        on_step: Callable[["LoopStep"], None | Awaitable[None]] | None = None,
+        use_responses_api: bool = True,
+        max_error_streak: int = 2,
+        requests_per_minute: int = _DEFAULT_REQUESTS_PER_MINUTE,
+    ) -> "LoopOptions":
+        """Create LoopOptions, constructing a tuned OpenAI client if needed.
+
+        When no client is supplied, one is built over an HTTP/2 httpx client
+        with keepalive limits, so all iterations - including parallel tool
+        calls - multiplex over a single TCP/TLS connection instead of paying
+        a handshake per request.
 
         Args:
-            step_type: Type of step ("thought", "tool_call", "tool_result", "response", "error")
-            content: Text content for thought/response/error steps
-            name: Tool name for tool_call/tool_result steps
-            arguments: Tool arguments for tool_call steps
-            result: Tool result for tool_result steps
+            model: Chat model name
+            memory: Long-lived memory client
+            openai: Pre-configured OpenAI client (optional)
+            api_key: API key, used only when no client is supplied
+            base_url: Base URL, used only when no client is supplied
+            search: Optional search client
+            embedding_model: Optional embedding model name
+            on_step: Optional step callback
+            use_responses_api: Whether to prefer the Responses API
+            max_error_streak: All-error iterations tolerated before bailing out
+            requests_per_minute: Proactive throttle on outbound OpenAI calls
+
+        Returns:
+            Configured LoopOptions
         """
-        self.type = step_type
-        self.content = content
-        self.name = name
-        self.arguments = arguments
-        self.result = result
+        if openai is None:
+            openai = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=50, max_connections=100
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                ),
+            )
+
+        return cls(
+            openai=openai,
+            model=model,
+            memory=memory,
+            search=search,
+            embedding_model=embedding_model,
+            on_step=on_step,
+            use_responses_api=use_responses_api,
+            max_error_streak=max_error_streak,
+            throttle=RateLimiter(requests_per_minute),
+        )
+
+
+@dataclass(slots=True)
+class LoopStep:
+    """A single step in the ReAct loop.
+
+    Slotted because several instances are allocated per iteration (one per
+    tool_call, tool_result, and response).
+
+    Attributes:
+        type: Type of step ("thought", "tool_call", "tool_result", "response", "error")
+        content: Text content for thought/response/error steps
+        name: Tool name for tool_call/tool_result steps
+        arguments: Tool arguments for tool_call steps
+        result: Tool result for tool_result steps
+    """
+
+    type: str
+    content: str = ""
+    name: str = ""
+    arguments: dict[str, Any] | None = None
+    result: Any = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert step to dictionary representation."""
@@ -104,6 +316,17 @@ class LoopStep:
         }
 
 
+class _ResponsesUnsupported(Exception):
+    """Raised when the provider rejects the very first Responses API call."""
+
+
+# Clients whose provider rejected the Responses API, keyed by client id.
+# One failed probe per client is enough - later turns skip straight to
+# chat completions instead of paying a guaranteed-failing round trip each
+# user message.
+_responses_unsupported: set[int] = set()
+
+
 async def run_react_loop(
     user_message: str,
     history: list[ChatCompletionMessageParam],
@@ -111,6 +334,11 @@ async def run_react_loop(
 ) -> str:
     """Run the ReAct loop to process a user message.
 
+    Prefers the Responses API, which retains conversation state server-side
+    via previous_response_id so each iteration only uploads the new tool
+    outputs instead of the full, growing message list. Providers that don't
+    support it fall back to the chat-completions loop.
+
     Args:
         user_message: The user's input message
         history: Conversation history (excluding current message)
@@ -119,22 +347,156 @@ async def run_react_loop(
     Returns:
         The agent's final response
     """
-    # Build messages: system + history + user message
-    messages: list[ChatCompletionMessageParam] = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        *history,
-        {"role": "user", "content": user_message},
-    ]
+    if (
+        options.use_responses_api
+        and id(options.openai) not in _responses_unsupported
+    ):
+        try:
+            return await _run_responses_loop(user_message, history, options)
+        except _ResponsesUnsupported:
+            _responses_unsupported.add(id(options.openai))
+
+    return await _run_chat_loop(user_message, history, options)
+
+
+async def _run_responses_loop(
+    user_message: str,
+    history: list[ChatCompletionMessageParam],
+    options: LoopOptions,
+) -> str:
+    """Run the ReAct loop over the Responses API.
+
+    Args:
+        user_message: The user's input message
+        history: Conversation history (excluding current message)
+        options: Loop configuration options
+
+    Returns:
+        The agent's final response
+
+    Raises:
+        _ResponsesUnsupported: If the provider rejects the first call
+    """
+    # Only the first call carries the history; afterwards the server keeps
+    # the transcript and each iteration uploads just the new tool outputs
+    input_items: list[Any] = list(history)
+    input_items.append({"role": "user", "content": user_message})
+    prev_id: str | None = None
+    error_streak = 0
+
+    for iteration in range(MAX_ITERATIONS):
+        try:
+            response = await _call_openai(
+                options,
+                lambda: options.openai.responses.create(
+                    model=options.model,
+                    instructions=SYSTEM_PROMPT,
+                    input=input_items,
+                    previous_response_id=prev_id,
+                    tools=get_responses_tools(),
+                    parallel_tool_calls=True,
+                ),
+            )
+        except (NotFoundError, BadRequestError):
+            if prev_id is None:
+                # Provider doesn't support the Responses API - let the
+                # caller fall back to chat completions
+                raise _ResponsesUnsupported()
+            raise
+
+        prev_id = response.id
+
+        tool_calls = [item for item in response.output if item.type == "function_call"]
+
+        if not tool_calls:
+            final_content = response.output_text or ""
+            _emit_step(options, LoopStep("response", content=final_content))
+            return final_content
+
+        # Intern tool names so handler-table lookups hit the identity fast path
+        tool_names = [sys.intern(item.name) for item in tool_calls]
+        parsed_args = [_parse_args(item.arguments) for item in tool_calls]
+        for tool_name, arguments in zip(tool_names, parsed_args):
+            _emit_step(
+                options,
+                LoopStep("tool_call", name=tool_name, arguments=arguments),
+            )
+
+        results = await _execute_tool_calls(tool_names, parsed_args, options)
+
+        input_items = []
+        for item, tool_name, result in zip(tool_calls, tool_names, results):
+            result_content = _compact_tool_result(tool_name, result)
+            _emit_step(
+                options,
+                LoopStep("tool_result", name=tool_name, result=result),
+            )
+            input_items.append({
+                "type": "function_call_output",
+                "call_id": item.call_id,
+                "output": result_content,
+            })
+
+        # Every tool in the iteration failed - likely a terminal condition
+        # (e.g. memory unreachable), so don't let the model retry to
+        # MAX_ITERATIONS
+        error_streak = error_streak + 1 if _all_errors(results) else 0
+        if error_streak >= options.max_error_streak:
+            input_items.append(_ERROR_STREAK_MESSAGE)
+            break
+    else:
+        # Max iterations reached - ask for final response
+        input_items.append(_MAX_ITERATIONS_MESSAGE)
+
+    final_response = await _call_openai(
+        options,
+        lambda: options.openai.responses.create(
+            model=options.model,
+            instructions=SYSTEM_PROMPT,
+            input=input_items,
+            previous_response_id=prev_id,
+        ),
+    )
+
+    final_content = final_response.output_text or ""
+    _emit_step(options, LoopStep("response", content=final_content))
+    return final_content
+
+
+async def _run_chat_loop(
+    user_message: str,
+    history: list[ChatCompletionMessageParam],
+    options: LoopOptions,
+) -> str:
+    """Run the ReAct loop over the chat-completions API.
+
+    Args:
+        user_message: The user's input message
+        history: Conversation history (excluding current message)
+        options: Loop configuration options
+
+    Returns:
+        The agent's final response
+    """
+    # Build messages: system + history + user message. extend/append avoids
+    # the intermediate tuple a *history spread would allocate.
+    messages: list[ChatCompletionMessageParam] = [_SYSTEM_MESSAGE]
+    messages.extend(history)
+    messages.append({"role": "user", "content": user_message})
 
     tools = get_memory_tools()
+    error_streak = 0
 
     for iteration in range(MAX_ITERATIONS):
         # Call LLM with tools
-        response = await options.openai.chat.completions.create(
-            model=options.model,
-            messages=messages,
-            tools=tools,
-            parallel_tool_calls=False,
+        response = await _call_openai(
+            options,
+            lambda: options.openai.chat.completions.create(
+                model=options.model,
+                messages=messages,
+                tools=tools,
+                parallel_tool_calls=True,
+            ),
         )
 
         message = response.choices[0].message
@@ -152,49 +514,52 @@ async def run_react_loop(
             _emit_step(options, LoopStep("response", content=final_content))
             return final_content
 
-        # Execute each tool call
-        for tool_call in message.tool_calls:
-            tool_name = tool_call.function.name
-            try:
-                args_json = tool_call.function.arguments
-                arguments = json.loads(args_json) if args_json else {}
-            except json.JSONDecodeError:
-                arguments = {}
-
+        # Parse arguments and emit tool_call steps in original order. Tool
+        # names are interned so handler-table lookups hit the identity fast path.
+        tool_names = [sys.intern(tool_call.function.name) for tool_call in message.tool_calls]
+        parsed_args = [
+            _parse_args(tool_call.function.arguments) for tool_call in message.tool_calls
+        ]
+        for tool_name, arguments in zip(tool_names, parsed_args):
             _emit_step(
                 options,
                 LoopStep("tool_call", name=tool_name, arguments=arguments),
             )
 
-            # Execute the tool
-            result = await _execute_tool(tool_name, arguments, options)
+        # Execute all tool calls concurrently - they are independent I/O-bound
+        # coroutines, so total latency is the slowest call rather than the sum.
+        results = await _execute_tool_calls(tool_names, parsed_args, options)
 
-            # Format result for LLM
-            result_content = json.dumps(_json_serializable(result), ensure_ascii=False)
+        # Emit results and append tool messages in original order so the
+        # tool_call_id ordering required by OpenAI is preserved
+        for tool_call, tool_name, result in zip(message.tool_calls, tool_names, results):
+            # Format result for LLM, compacting oversized payloads
+            result_content = _compact_tool_result(tool_name, result)
             _emit_step(
                 options,
                 LoopStep("tool_result", name=tool_name, result=result),
             )
 
             # Add tool result message
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "content": result_content,
-            })
-
-    # Max iterations reached - ask for final response
-    messages.append({
-        "role": "system",
-        "content": (
-            "You have reached the maximum number of iterations. "
-            "Please provide your final response to the user now."
+            messages.append(_tool_msg(tool_call.id, result_content))
+
+        # Every tool in the iteration failed - likely a terminal condition
+        # (e.g. memory unreachable), so don't let the model retry to
+        # MAX_ITERATIONS
+        error_streak = error_streak + 1 if _all_errors(results) else 0
+        if error_streak >= options.max_error_streak:
+            messages.append(_ERROR_STREAK_MESSAGE)
+            break
+    else:
+        # Max iterations reached - ask for final response
+        messages.append(_MAX_ITERATIONS_MESSAGE)
+
+    final_response = await _call_openai(
+        options,
+        lambda: options.openai.chat.completions.create(
+            model=options.model,
+            messages=messages,
         ),
-    })
-
-    final_response = await options.openai.chat.completions.create(
-        model=options.model,
-        messages=messages,
     )
 
     final_content = final_response.choices[0].message.content or ""
@@ -202,6 +567,123 @@ async def run_react_loop(
     return final_content
 
 
+async def _execute_tool_calls(
+    tool_names: list[str],
+    parsed_args: list[dict[str, Any]],
+    options: LoopOptions,
+) -> list[dict[str, Any]]:
+    """Execute one turn's tool calls, returning results in original order.
+
+    When the model emits several embedding calls in the same turn, they are
+    collapsed into a single embeddings API request (the endpoint accepts a
+    list of inputs), while the remaining tools run concurrently alongside it.
+    _execute_tool catches exceptions itself, so gather never cancels siblings.
+
+    Args:
+        tool_names: Tool names from the LLM response
+        parsed_args: Parsed arguments, parallel to tool_names
+        options: Loop configuration options
+
+    Returns:
+        One result dict per tool call, in the same order
+    """
+    embed_indices = [i for i, name in enumerate(tool_names) if name == "embedding"]
+
+    if len(embed_indices) < 2:
+        gathered = await asyncio.gather(
+            *(
+                _execute_tool(name, args, options)
+                for name, args in zip(tool_names, parsed_args)
+            ),
+            return_exceptions=True,
+        )
+        return [
+            {"error": str(r)} if isinstance(r, BaseException) else r for r in gathered
+        ]
+
+    texts = [parsed_args[i].get("text", "") for i in embed_indices]
+    other = [
+        (i, name) for i, name in enumerate(tool_names) if name != "embedding"
+    ]
+
+    gathered = await asyncio.gather(
+        _batch_embeddings(texts, options),
+        *(_execute_tool(name, parsed_args[i], options) for i, name in other),
+        return_exceptions=True,
+    )
+
+    batch = gathered[0]
+    if isinstance(batch, BaseException):
+        batch = [{"error": str(batch)}] * len(embed_indices)
+
+    results: list[dict[str, Any]] = [{}] * len(tool_names)
+    for i, result in zip(embed_indices, batch):
+        results[i] = result
+    for (i, _), result in zip(other, gathered[1:]):
+        results[i] = {"error": str(result)} if isinstance(result, BaseException) else result
+    return results
+
+
+async def _batch_embeddings(
+    texts: list[str],
+    options: LoopOptions,
+) -> list[dict[str, Any]]:
+    """Generate embeddings for several texts in a single API call.
+
+    Args:
+        texts: Texts to embed
+        options: Loop options containing OpenAI client
+
+    Returns:
+        One result dict per text, in input order
+    """
+    model = options.embedding_model or "text-embedding-3-small"
+
+    try:
+        response = await _call_openai(
+            options,
+            lambda: options.openai.embeddings.create(model=model, input=texts),
+        )
+    except Exception as e:
+        return [{"error": str(e)}] * len(texts)
+
+    return [{"vector": item.embedding} for item in response.data]
+
+
+def _tool_msg(tool_call_id: str, content: str) -> ChatCompletionMessageParam:
+    """Build a tool-result message.
+
+    A single construction site keeps the key layout fixed, so CPython builds
+    every tool message from the same cached literal shape.
+
+    Args:
+        tool_call_id: ID of the tool call being answered
+        content: Serialized tool result
+
+    Returns:
+        Tool message dict for the chat-completions API
+    """
+    return {"role": "tool", "tool_call_id": tool_call_id, "content": content}
+
+
+def _parse_args(args_json: str | None) -> dict[str, Any]:
+    """Parse the JSON arguments of a tool call.
+
+    Args:
+        args_json: Raw JSON argument string from the LLM response
+
+    Returns:
+        Parsed arguments dictionary (empty on malformed JSON)
+    """
+    # Skip parser entry entirely for the common empty case
+    if not args_json or args_json == "{}":
+        return {}
+    try:
+        return orjson.loads(args_json)
+    except orjson.JSONDecodeError:
+        return {}
+
+
 async def _execute_tool(
     name: str,
     arguments: dict[str, Any],
@@ -217,36 +699,93 @@ async def _execute_tool(
     Returns:
         Tool result as dictionary
     """
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return {"error": f"Unknown tool: {name}"}
+
     try:
-        match name:
-            case "memory_query":
-                cypher = arguments.get("cypher", "")
-                params = arguments.get("params", {})
-                return await options.memory.query(cypher, params)
+        return await handler(arguments, options)
+    except Exception as e:
+        return {"error": str(e)}
 
-            case "memory_write":
-                cypher = arguments.get("cypher", "")
-                params = arguments.get("params", {})
-                return await options.memory.write(cypher, params)
 
-            case "memory_schema":
-                return await options.memory.schema()
+async def _handle_memory_query(
+    arguments: dict[str, Any], options: LoopOptions
+) -> dict[str, Any]:
+    """Handle the memory_query tool."""
+    return await options.memory.query(
+        arguments.get("cypher", ""), arguments.get("params", {})
+    )
 
-            case "embedding":
-                text = arguments.get("text", "")
-                return await _generate_embedding(text, options)
 
-            case "web_search":
-                query = arguments.get("query", "")
-                num_results = arguments.get("num_results")
-                search_type = arguments.get("type", "search")
-                return await _web_search(query, num_results, search_type, options)
+async def _handle_memory_write(
+    arguments: dict[str, Any], options: LoopOptions
+) -> dict[str, Any]:
+    """Handle the memory_write tool."""
+    result = await options.memory.write(
+        arguments.get("cypher", ""), arguments.get("params", {})
+    )
+    # The write may have introduced new labels or property keys
+    _invalidate_schema_cache(options.memory)
+    return result
 
-            case _:
-                return {"error": f"Unknown tool: {name}"}
 
-    except Exception as e:
-        return {"error": str(e)}
+# Schema changes are rare and the system prompt encourages schema inspection,
+# so cache results briefly per memory client; writes invalidate eagerly
+_SCHEMA_CACHE_TTL: float = 60.0
+_schema_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+
+
+def _invalidate_schema_cache(memory: MemoryClient) -> None:
+    """Drop the cached schema for a memory client after a write."""
+    _schema_cache.pop(id(memory), None)
+
+
+async def _handle_memory_schema(
+    arguments: dict[str, Any], options: LoopOptions
+) -> dict[str, Any]:
+    """Handle the memory_schema tool, serving recent results from cache."""
+    key = id(options.memory)
+    entry = _schema_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < _SCHEMA_CACHE_TTL:
+        return entry[1]
+
+    schema = await options.memory.schema()
+    _schema_cache[key] = (now, schema)
+    return schema
+
+
+async def _handle_embedding(
+    arguments: dict[str, Any], options: LoopOptions
+) -> dict[str, Any]:
+    """Handle the embedding tool."""
+    return await _generate_embedding(arguments.get("text", ""), options)
+
+
+async def _handle_web_search(
+    arguments: dict[str, Any], options: LoopOptions
+) -> dict[str, Any]:
+    """Handle the web_search tool."""
+    return await _web_search(
+        arguments.get("query", ""),
+        arguments.get("num_results"),
+        arguments.get("type", "search"),
+        options,
+    )
+
+
+# Tool-name dispatch table - a hash lookup instead of a match ladder,
+# so adding a tool stays O(1) per call
+_TOOL_HANDLERS: dict[
+    str, Callable[[dict[str, Any], LoopOptions], Awaitable[dict[str, Any]]]
+] = {
+    "memory_query": _handle_memory_query,
+    "memory_write": _handle_memory_write,
+    "memory_schema": _handle_memory_schema,
+    "embedding": _handle_embedding,
+    "web_search": _handle_web_search,
+}
 
 
 async def _generate_embedding(
@@ -263,13 +802,53 @@ async def _generate_embedding(
         Dictionary with vector embedding
     """
     model = options.embedding_model or "text-embedding-3-small"
+    vector = await _embed_cached(options, model, text)
+    return {"vector": list(vector)}
+
+
+# LRU cache for embeddings keyed on (model, text) - agents frequently re-embed
+# the same strings, and each miss costs a network round-trip
+_EMBEDDING_CACHE_SIZE: int = 1024
+_embedding_cache: OrderedDict[tuple[str, str], tuple[float, ...]] = OrderedDict()
+_embedding_cache_lock = asyncio.Lock()
+
+
+async def _embed_cached(
+    options: LoopOptions,
+    model: str,
+    text: str,
+) -> tuple[float, ...]:
+    """Generate an embedding, serving repeats from an in-process LRU cache.
 
-    response = await options.openai.embeddings.create(
-        model=model,
-        input=text,
+    Args:
+        options: Loop options containing OpenAI client
+        model: Embedding model name
+        text: Text to embed
+
+    Returns:
+        Embedding vector as an immutable tuple (shared across cache hits)
+    """
+    key = (model, text)
+
+    async with _embedding_cache_lock:
+        cached = _embedding_cache.get(key)
+        if cached is not None:
+            _embedding_cache.move_to_end(key)
+            return cached
+
+    response = await _call_openai(
+        options,
+        lambda: options.openai.embeddings.create(model=model, input=text),
     )
+    vector = tuple(response.data[0].embedding)
+
+    async with _embedding_cache_lock:
+        _embedding_cache[key] = vector
+        _embedding_cache.move_to_end(key)
+        if len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
 
-    return {"vector": response.data[0].embedding}
+    return vector
 
 
 async def _web_search(
@@ -316,12 +895,28 @@ async def _web_search(
     }
 
 
+# Strong references to in-flight async on_step tasks: the event loop only
+# keeps weak references, so without this a pending callback could be
+# garbage-collected mid-execution
+_step_tasks: set[asyncio.Task] = set()
+
+
 def _emit_step(options: LoopOptions, step: LoopStep) -> None:
     """Emit a step callback if provided.
 
+    Sync callbacks run inline; async callbacks are scheduled as a task so
+    observability I/O overlaps the next LLM call instead of stalling the loop.
+
     Args:
         options: Loop options
         step: The step to emit
     """
-    if options.on_step:
-        options.on_step(step)
+    callback = options.on_step
+    if callback is None:
+        return
+
+    result = callback(step)
+    if asyncio.iscoroutine(result):
+        task = asyncio.create_task(result)
+        _step_tasks.add(task)
+        task.add_done_callback(_step_tasks.discard)
@@ -1,12 +1,16 @@
 """Tool definitions for the ReAct loop agent."""
 
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+
 from openai.types.chat import (
     ChatCompletionToolParam,
 )
 
 
-def get_memory_tools() -> list[ChatCompletionToolParam]:
-    """Return the list of available memory tools.
+def _build_memory_tools() -> list[ChatCompletionToolParam]:
+    """Build the list of available memory tools.
 
     These tools are registered with OpenAI's function calling API.
     Each tool definition includes name, description, and parameter schema.
@@ -140,3 +144,77 @@ def get_memory_tools() -> list[ChatCompletionToolParam]:
             },
         },
     ]
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and lists in tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Convert a frozen schema back to plain dicts/lists for the SDK."""
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+# The tool schema is static, so build it once at import time and freeze it -
+# nothing can accidentally mutate the shared definitions between calls.
+_MEMORY_TOOLS: tuple[Any, ...] = _freeze(_build_memory_tools())
+
+
+@cache
+def get_memory_tools() -> list[ChatCompletionToolParam]:
+    """Return the list of available memory tools.
+
+    The canonical schema is frozen; the plain-dict form the SDK needs is
+    materialized once on first call and cached. Callers must treat the
+    returned list as immutable.
+
+    Returns:
+        List of tool definitions for function calling
+    """
+    return _thaw(_MEMORY_TOOLS)
+
+
+def _build_responses_tools() -> list[dict[str, Any]]:
+    """Flatten the chat-completions tool schema into Responses API format.
+
+    The Responses API takes name/description/parameters at the top level
+    of each tool instead of nested under a "function" key.
+
+    Returns:
+        List of tool definitions for the Responses API
+    """
+    tools: list[dict[str, Any]] = []
+    for tool in get_memory_tools():
+        function = tool["function"]
+        tools.append({
+            "type": "function",
+            "name": function["name"],
+            "description": function["description"],
+            "parameters": function["parameters"],
+            "strict": function.get("strict", True),
+        })
+    return tools
+
+
+_RESPONSES_TOOLS: list[dict[str, Any]] = _build_responses_tools()
+
+
+def get_responses_tools() -> list[dict[str, Any]]:
+    """Return the memory tools in Responses API format.
+
+    Returns the shared, module-level tool definitions. Callers must treat
+    the returned list as immutable.
+
+    Returns:
+        List of tool definitions for the Responses API
+    """
+    return _RESPONSES_TOOLS
@@ -1,11 +1,14 @@
 """Interactive CLI interface for nakari."""
 
 import asyncio
+import io
 import os
-from datetime import date, time, datetime
-from typing import Any
+import reprlib
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from openai import AsyncOpenAI
+import orjson
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -17,29 +20,16 @@ from .memory import MemoryClient
 from .search import create_serper_client
 
 
-def _json_serializable(obj: Any) -> Any:
-    """Convert an object to a JSON-serializable format."""
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
+def _orjson_default(obj: Any) -> Any:
+    """Fallback serializer for types orjson cannot encode natively.
 
-    if hasattr(obj, "__class__") and obj.__class__.__name__ == "Record":
-        return {k: _json_serializable(v) for k, v in obj.items()}
-
-    if hasattr(obj, "__class__") and "neo4j" in getattr(obj.__class__, "__module__", ""):
-        return str(obj)
-
-    if isinstance(obj, (date, time, datetime)):
-        return obj.isoformat()
-
-    if isinstance(obj, dict):
-        return {k: _json_serializable(v) for k, v in obj.items()}
-
-    if isinstance(obj, list):
-        return [_json_serializable(v) for v in obj]
-
-    if isinstance(obj, tuple):
-        return [_json_serializable(v) for v in obj]
+    orjson walks containers and datetimes in C, so this runs only for the
+    exotic cases - work is O(unique exotic values), not O(total nodes).
+    """
+    if obj.__class__.__name__ == "Record":
+        return dict(obj)
 
+    # Everything else (Neo4j temporal/spatial types included) stringifies
     return str(obj)
 
 
@@ -61,6 +51,42 @@ class Colors:
 console = Console()
 
 
+def _install_buffered_stdout() -> Console:
+    """Wrap stdout in an 8KB buffer so console writes batch into fewer syscalls.
+
+    A ReAct loop emits hundreds of small writes; block buffering coalesces
+    them and the REPL flushes explicitly at step boundaries and before
+    reading input. sys.stdout is rebound so the interpreter's exit flush
+    covers any buffered tail.
+
+    Returns:
+        Console over the buffered stream, or a default Console when stdout
+        has no underlying binary buffer (e.g. under test capture)
+    """
+    try:
+        buffered = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, buffer_size=8192),
+            encoding=sys.stdout.encoding or "utf-8",
+            errors="replace",
+            line_buffering=False,
+            write_through=False,
+        )
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return Console()
+
+    sys.stdout = buffered
+    return Console(file=buffered)
+
+# Icon per tool name, shared across all tool-step renders
+_TOOL_ICONS: Mapping[str, str] = MappingProxyType({
+    "memory_query": "🔍",
+    "memory_write": "✏️",
+    "memory_schema": "📋",
+    "embedding": "🧮",
+    "web_search": "🌐",
+})
+
+
 def print_header(text: str) -> None:
     """Print a header with styling."""
     console.print(Panel(text, title="[bold blue]nakari[/bold blue]", border_style="blue"))
@@ -71,46 +97,66 @@ def print_thought(content: str) -> None:
     console.print(Panel(content, title="[dim]Thought[/dim]", border_style="dim white"))
 
 
+# Bounded repr for argument previews - short-circuits long/nested values
+# instead of materializing their full string form
+_SHORT_REPR = reprlib.Repr()
+_SHORT_REPR.maxstring = 60
+_SHORT_REPR.maxother = 60
+
+
+def _short(value: Any) -> str:
+    """Render a value capped at ~60 chars for display.
+
+    Args:
+        value: Argument value to preview
+
+    Returns:
+        Possibly truncated display string
+    """
+    if isinstance(value, str):
+        return value if len(value) <= 60 else value[:60] + "..."
+    return _SHORT_REPR.repr(value)
+
+
 def print_tool_call(name: str, arguments: dict[str, Any]) -> None:
     """Print a tool call step - simplified format like TypeScript version."""
     # Format: 🔍 memory_query\n    Cypher: ...\n    → ...
-    icons = {
-        "memory_query": "🔍",
-        "memory_write": "✏️",
-        "memory_schema": "📋",
-        "embedding": "🧮",
-        "web_search": "🌐",
-    }
-    icon = icons.get(name, "🔧")
-
-    # Print tool name with icon
-    console.print(f"[dim]{icon} {name}[/dim]")
-
-    # Print arguments in a simplified format
+    icon = _TOOL_ICONS.get(name, "🔧")
+
+    # Build the whole step as one Text so only a single console.print pays
+    # Rich's markup/ANSI rendering cost
+    text = Text()
+    text.append(f"{icon} {name}", style="dim")
+
+    # Append arguments in a simplified format
     if arguments:
         for key, value in arguments.items():
             if key == "cypher":
                 # Show full Cypher queries
-                console.print(f"    [dim]Cypher:[/dim] {value}")
+                text.append("\n    Cypher: ", style="dim")
+                text.append(str(value))
             elif key == "params" and value:
-                console.print(f"    [dim]Params:[/dim] {value}")
+                text.append("\n    Params: ", style="dim")
+                text.append(str(value))
             elif key == "text":
-                text_str = str(value)
-                if len(text_str) > 60:
-                    text_str = text_str[:60] + "..."
-                console.print(f"    [dim]Text:[/dim] {text_str}")
+                text.append("\n    Text: ", style="dim")
+                text.append(_short(value))
             elif key == "query":
-                query_str = str(value)
-                if len(query_str) > 60:
-                    query_str = query_str[:60] + "..."
-                console.print(f"    [dim]Query:[/dim] {query_str}")
+                text.append("\n    Query: ", style="dim")
+                text.append(_short(value))
             else:
-                console.print(f"    [dim]{key}:[/dim] {value}")
+                text.append(f"\n    {key}: ", style="dim")
+                text.append(str(value))
+
+    console.print(text)
 
 
 def print_tool_result(name: str, result: Any) -> None:
     """Print a tool result step - simplified format like TypeScript version."""
     # Format: → 2 nodes, 1 rels, 5 props
+    # Build the full line first so the function issues one console write
+    line: str | None = None
+
     if isinstance(result, dict):
         if "stats" in result:
             stats = result["stats"]
@@ -122,9 +168,9 @@ def print_tool_result(name: str, result: Any) -> None:
             if stats.get("propertiesSet", 0) > 0:
                 parts.append(f"{stats['propertiesSet']} props")
             if parts:
-                console.print(f"    [dim]→ [/dim]{', '.join(parts)}")
+                line = f"    [dim]→ [/dim]{', '.join(parts)}"
             elif any(stats.values()):
-                console.print(f"    [dim]→ {stats}[/dim]")
+                line = f"    [dim]→ {stats}[/dim]"
         elif "labels" in result or "relationshipTypes" in result:
             # Schema result
             labels = result.get("labels", [])
@@ -137,24 +183,27 @@ def print_tool_result(name: str, result: Any) -> None:
                 parts.append(f"{len(rels)} rel types")
             if props:
                 parts.append(f"{len(props)} props")
-            console.print(f"    [dim]→ [/dim]{', '.join(parts)}")
+            line = f"    [dim]→ [/dim]{', '.join(parts)}"
         elif "records" in result:
             records = result["records"]
             if records:
-                console.print(f"    [dim]→ {len(records)} records[/dim]")
+                line = f"    [dim]→ {len(records)} records[/dim]"
             else:
-                console.print(f"    [dim]→ (no records)[/dim]")
+                line = f"    [dim]→ (no records)[/dim]"
         elif "error" in result:
-            console.print(f"    [dim]→ [red]Error: {result['error']}[/red][/dim]")
+            line = f"    [dim]→ [red]Error: {result['error']}[/red][/dim]"
         elif "results" in result:
             # Search result
             results = result.get("results", [])
             total = result.get("totalResults", len(results))
-            console.print(f"    [dim]→ {total} results[/dim]")
+            line = f"    [dim]→ {total} results[/dim]"
         else:
-            console.print(f"    [dim]→ {result}[/dim]")
+            line = f"    [dim]→ {result}[/dim]"
     else:
-        console.print(f"    [dim]→ {result}[/dim]")
+        line = f"    [dim]→ {result}[/dim]"
+
+    if line is not None:
+        console.print(line)
 
 
 def print_response(content: str) -> None:
@@ -213,13 +262,18 @@ def _format_json(obj: Any) -> str:
     Returns:
         JSON string representation
     """
-    import json
-
-    return json.dumps(_json_serializable(obj), ensure_ascii=False, indent=2)
+    return orjson.dumps(
+        obj,
+        default=_orjson_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 async def main() -> None:
     """Main entry point for the CLI."""
+    global console
+    console = _install_buffered_stdout()
+
     # Load configuration
     config = Config.from_env()
 
@@ -229,11 +283,6 @@ async def main() -> None:
         return
 
     # Initialize clients
-    openai = AsyncOpenAI(
-        api_key=config.openai.api_key,
-        base_url=config.openai.base_url,
-    )
-
     memory = MemoryClient(
         uri=config.neo4j.uri,
         user=config.neo4j.user,
@@ -248,6 +297,19 @@ async def main() -> None:
             timeout=config.search.timeout,
         )
 
+    # LoopOptions.build constructs an HTTP/2 OpenAI client with keepalive,
+    # shared across all turns of the conversation
+    loop_options = LoopOptions.build(
+        model=config.openai.model,
+        embedding_model=config.openai.embedding_model,
+        memory=memory,
+        search=search_client,
+        api_key=config.openai.api_key,
+        base_url=config.openai.base_url,
+        on_step=_handle_step,
+    )
+    openai = loop_options.openai
+
     try:
         # Verify connectivity
         console.print("[dim]Connecting to Neo4j...[/dim]")
@@ -271,8 +333,11 @@ async def main() -> None:
         # Main REPL loop
         while True:
             try:
-                # Get user input
-                user_input = console.input("[bold blue]You:[/bold blue] ")
+                # Get user input - flush so the prompt leaves the buffer
+                # before blocking on stdin
+                console.print("[bold blue]You:[/bold blue] ", end="")
+                console.file.flush()
+                user_input = input()
 
                 if not user_input.strip():
                     continue
@@ -290,16 +355,6 @@ async def main() -> None:
                         print_schema(schema)
                         continue
 
-                # Create loop options
-                loop_options = LoopOptions(
-                    openai=openai,
-                    model=config.openai.model,
-                    embedding_model=config.openai.embedding_model,
-                    memory=memory,
-                    search=search_client,
-                    on_step=lambda step: _handle_step(step),
-                )
-
                 # Run ReAct loop
                 console.print()
                 response = await run_react_loop(user_input, history, loop_options)
@@ -323,32 +378,59 @@ async def main() -> None:
                 break
 
     finally:
-        # Clean up
+        # Clean up - flush so buffered output (including errors) is visible
+        console.file.flush()
         await memory.close()
         if search_client:
             await search_client._provider.close()  # type: ignore[attr-defined]
         await openai.close()
 
 
+def _handle_thought(step: LoopStep) -> None:
+    if step.content:
+        print_thought(step.content)
+
+
+def _handle_tool_call(step: LoopStep) -> None:
+    print_tool_call(step.name, step.arguments or {})
+
+
+def _handle_tool_result(step: LoopStep) -> None:
+    print_tool_result(step.name, step.result)
+
+
+def _handle_response(step: LoopStep) -> None:
+    if step.content:
+        print_response(step.content)
+
+
+def _handle_error(step: LoopStep) -> None:
+    print_error(step.content)
+
+
+# step type -> handler: a single hash lookup per step instead of a
+# structural-match walk on the tool-call hot path
+_STEP_HANDLERS: Mapping[str, Any] = MappingProxyType({
+    "thought": _handle_thought,
+    "tool_call": _handle_tool_call,
+    "tool_result": _handle_tool_result,
+    "response": _handle_response,
+    "error": _handle_error,
+})
+
+
 def _handle_step(step: LoopStep) -> None:
     """Handle a step callback from the ReAct loop.
 
     Args:
         step: The loop step to handle
     """
-    match step.type:
-        case "thought":
-            if step.content:
-                print_thought(step.content)
-        case "tool_call":
-            print_tool_call(step.name, step.arguments or {})
-        case "tool_result":
-            print_tool_result(step.name, step.result)
-        case "response":
-            if step.content:
-                print_response(step.content)
-        case "error":
-            print_error(step.content)
+    handler = _STEP_HANDLERS.get(step.type)
+    if handler is not None:
+        handler(step)
+
+    # Flush once per step boundary so progress appears promptly
+    console.file.flush()
 
 
 if __name__ == "__main__":
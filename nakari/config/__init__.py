@@ -1,13 +1,11 @@
 """Configuration management module."""
 
+import os
 from dataclasses import dataclass, field
-from os import getenv
 from typing import Literal
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
 
 @dataclass(frozen=True)
 class OpenAIConfig:
@@ -48,28 +46,35 @@ class Config:
 
     @classmethod
     def from_env(cls) -> "Config":
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables.
+
+        Loads .env lazily (only when config is actually read, not at
+        import) and reads all keys from one os.environ reference.
+        """
+        load_dotenv()
+        env = os.environ
+
         openai = OpenAIConfig(
-            api_key=getenv("OPENAI_API_KEY", ""),
-            model=getenv("OPENAI_MODEL", "gpt-4o"),
-            embedding_model=getenv("OPENAI_EMBEDDING_MODEL"),
-            base_url=getenv("OPENAI_BASE_URL"),
+            api_key=env.get("OPENAI_API_KEY", ""),
+            model=env.get("OPENAI_MODEL", "gpt-4o"),
+            embedding_model=env.get("OPENAI_EMBEDDING_MODEL"),
+            base_url=env.get("OPENAI_BASE_URL"),
         )
 
         neo4j = Neo4jConfig(
-            uri=getenv("NEO4J_URI", "bolt://localhost:7687"),
-            user=getenv("NEO4J_USER", "neo4j"),
-            password=getenv("NEO4J_PASSWORD", "nakari-dev"),
+            uri=env.get("NEO4J_URI", "bolt://localhost:7687"),
+            user=env.get("NEO4J_USER", "neo4j"),
+            password=env.get("NEO4J_PASSWORD", "nakari-dev"),
         )
 
-        serper_key = getenv("SERPER_API_KEY")
+        serper_key = env.get("SERPER_API_KEY")
         search: SearchConfig | None = None
         if serper_key:
             search = SearchConfig(
                 provider="serper",
                 api_key=serper_key,
-                base_url=getenv("SERPER_BASE_URL"),
-                timeout=int(getenv("SERPER_TIMEOUT", "20")),
+                base_url=env.get("SERPER_BASE_URL"),
+                timeout=int(env.get("SERPER_TIMEOUT", "20")),
             )
 
         return cls(openai=openai, neo4j=neo4j, search=search)
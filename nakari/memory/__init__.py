@@ -1,13 +1,42 @@
 """Memory module for Neo4j graph database integration."""
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, Record
-from typing import Any
+import time
+
+from neo4j import READ_ACCESS, AsyncGraphDatabase, AsyncDriver, Record, RoutingControl
+from neo4j.graph import Node, Relationship
+from neo4j.time import Date, DateTime, Duration, Time
+from typing import Any, AsyncIterator, Callable
+
+# Single Cypher round-trip collecting labels, relationship types, and
+# property keys - one query instead of three sequential sessions
+_SCHEMA_CYPHER = (
+    "CALL db.labels() YIELD label "
+    "WITH collect(label) AS labels "
+    "CALL db.relationshipTypes() YIELD relationshipType "
+    "WITH labels, collect(relationshipType) AS types "
+    "CALL db.propertyKeys() YIELD propertyKey "
+    "RETURN labels, types, collect(propertyKey) AS keys"
+)
+
+# Upper bound on pooled connections per driver - concurrent tool calls
+# dispatched via asyncio.gather draw from this pool in parallel
+MAX_CONNECTION_POOL_SIZE: int = 50
+
+# How long a schema() result stays fresh; the schema is near-static within
+# a session and writes that change it invalidate the cache eagerly
+SCHEMA_CACHE_TTL: float = 30.0
 
 
 class MemoryClient:
     """Neo4j memory client for graph database operations.
 
     Provides query, write, schema inspection, and connection management.
+
+    The client is long-lived: construct one instance per process and share
+    it. The underlying driver keeps a bounded connection pool, and queries
+    go through ``execute_query`` with the driver's default bookmark manager,
+    so reads issued after a write observe that write (causal consistency)
+    while connections are reused instead of opened per call.
     """
 
     def __init__(self, uri: str, user: str, password: str) -> None:
@@ -19,10 +48,14 @@ class MemoryClient:
             password: Database password
         """
         self._driver: AsyncDriver = AsyncGraphDatabase.driver(
-            uri, auth=(user, password)
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
         )
         self._uri = uri
         self._user = user
+        self._schema_cache: tuple[float, dict[str, Any]] | None = None
+        self._schema_ttl = SCHEMA_CACHE_TTL
 
     async def query(
         self, cypher: str, params: dict[str, Any]
@@ -36,10 +69,34 @@ class MemoryClient:
         Returns:
             Dictionary with 'records' key containing list of result records
         """
-        async with self._driver.session() as session:
+        records = [record async for record in self.query_iter(cypher, params)]
+        return {"records": records}
+
+    async def query_iter(
+        self, cypher: str, params: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a read-only Cypher query's records one at a time.
+
+        Records are yielded as the driver fetches them, so large result
+        sets never materialize fully in memory and callers can stop early
+        (e.g. for a truncated preview). The session shares the driver's
+        execute_query bookmark manager, so reads still observe prior
+        writes.
+
+        Args:
+            cypher: Parameterized Cypher query string
+            params: Query parameters (for parameterized queries)
+
+        Yields:
+            One converted record dictionary per result row
+        """
+        async with self._driver.session(
+            default_access_mode=READ_ACCESS,
+            bookmark_manager=self._driver.execute_query_bookmark_manager,
+        ) as session:
             result = await session.run(cypher, params)
-            records = [self._convert_record(record) async for record in result]
-            return {"records": records}
+            async for record in result:
+                yield _convert_record(record)
 
     async def write(
         self, cypher: str, params: dict[str, Any]
@@ -53,54 +110,61 @@ class MemoryClient:
         Returns:
             Dictionary with 'stats' key containing operation statistics
         """
-        async with self._driver.session() as session:
-            result = await session.run(cypher, params)
-            summary = await result.consume()
-            stats = {
-                "nodesCreated": summary.counters.nodes_created,
-                "nodesDeleted": summary.counters.nodes_deleted,
-                "relationshipsCreated": summary.counters.relationships_created,
-                "relationshipsDeleted": summary.counters.relationships_deleted,
-                "propertiesSet": summary.counters.properties_set,
-                "labelsAdded": summary.counters.labels_added,
-            }
-            return {"stats": stats}
+        result = await self._driver.execute_query(
+            cypher, params, routing_=RoutingControl.WRITE
+        )
+        summary = result.summary
+        stats = {
+            "nodesCreated": summary.counters.nodes_created,
+            "nodesDeleted": summary.counters.nodes_deleted,
+            "relationshipsCreated": summary.counters.relationships_created,
+            "relationshipsDeleted": summary.counters.relationships_deleted,
+            "propertiesSet": summary.counters.properties_set,
+            "labelsAdded": summary.counters.labels_added,
+        }
+
+        # New labels, relationship types, or property keys make the cached
+        # schema stale
+        if (
+            stats["labelsAdded"]
+            or stats["relationshipsCreated"]
+            or stats["propertiesSet"]
+        ):
+            self.invalidate_schema()
+
+        return {"stats": stats}
 
     async def schema(self) -> dict[str, Any]:
         """Inspect the database schema.
 
+        Results are memoized for a short TTL; writes that may change the
+        schema invalidate the cache eagerly.
+
         Returns:
             Dictionary with 'labels', 'relationshipTypes', and 'propertyKeys' keys
         """
-        async with self._driver.session() as session:
-            # Get all node labels
-            label_result = await session.run(
-                "CALL db.labels() YIELD label RETURN collect(label) AS labels"
-            )
-            label_record = await label_result.single()
-            labels = label_record["labels"] if label_record else []
-
-            # Get all relationship types
-            rel_result = await session.run(
-                "CALL db.relationshipTypes() YIELD relationshipType "
-                "RETURN collect(relationshipType) AS types"
-            )
-            rel_record = await rel_result.single()
-            relationship_types = rel_record["types"] if rel_record else []
-
-            # Get all property keys
-            prop_result = await session.run(
-                "CALL db.propertyKeys() YIELD propertyKey "
-                "RETURN collect(propertyKey) AS keys"
-            )
-            prop_record = await prop_result.single()
-            property_keys = prop_record["keys"] if prop_record else []
-
-            return {
-                "labels": labels,
-                "relationshipTypes": relationship_types,
-                "propertyKeys": property_keys,
-            }
+        if (
+            self._schema_cache is not None
+            and time.monotonic() - self._schema_cache[0] < self._schema_ttl
+        ):
+            return self._schema_cache[1]
+
+        result = await self._driver.execute_query(
+            _SCHEMA_CYPHER, {}, routing_=RoutingControl.READ
+        )
+        record = result.records[0] if result.records else None
+
+        schema = {
+            "labels": record["labels"] if record else [],
+            "relationshipTypes": record["types"] if record else [],
+            "propertyKeys": record["keys"] if record else [],
+        }
+        self._schema_cache = (time.monotonic(), schema)
+        return schema
+
+    def invalidate_schema(self) -> None:
+        """Drop the cached schema so the next schema() call hits the database."""
+        self._schema_cache = None
 
     async def verify_connectivity(self) -> None:
         """Verify connectivity to the Neo4j database.
@@ -115,51 +179,73 @@ class MemoryClient:
         """Close the database driver connection."""
         await self._driver.close()
 
-    def _convert_record(self, record: Record) -> dict[str, Any]:
-        """Convert a Neo4j Record to a plain Python dictionary.
+def _identity(value: Any) -> Any:
+    return value
 
-        Args:
-            record: Neo4j Record object
 
-        Returns:
-            Plain Python dictionary with converted types
-        """
-        result: dict[str, Any] = {}
-        for key, value in record.items():
-            result[key] = self._convert_value(value)
-        return result
+def _convert_list(value: list[Any]) -> list[Any]:
+    return [_convert_value(v) for v in value]
 
-    def _convert_value(self, value: Any) -> Any:
-        """Convert Neo4j types to plain Python types.
 
-        Args:
-            value: Value from Neo4j
+def _convert_dict(value: dict[str, Any]) -> dict[str, Any]:
+    return {k: _convert_value(v) for k, v in value.items()}
 
-        Returns:
-            Converted Python value
-        """
-        from neo4j.time import Date, Time, DateTime, Duration
-
-        # Check if value is a Node or Relationship by duck typing
-        # In neo4j 6.x, these are not directly exported
-        if hasattr(value, "_labels"):
-            # This is a Node
-            result = {"_type": "node", "_labels": list(value._labels)}
-            result.update(dict(value))
-            return result
-        elif hasattr(value, "_type"):
-            # This is a Relationship
-            result = {
-                "_type": "relationship",
-                "_relationshipType": value._type,
-            }
-            result.update(dict(value))
-            return result
-        elif isinstance(value, (Date, Time, DateTime, Duration)):
-            return str(value)
-        elif isinstance(value, list):
-            return [self._convert_value(v) for v in value]
-        elif isinstance(value, dict):
-            return {k: self._convert_value(v) for k, v in value.items()}
-        else:
-            return value
+
+# type -> converter table: every scalar in every record goes through
+# _convert_value, so common types resolve in one dict lookup instead of an
+# isinstance chain
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    list: _convert_list,
+    dict: _convert_dict,
+    Date: str,
+    Time: str,
+    DateTime: str,
+    Duration: str,
+}
+
+
+def _convert_record(record: Record) -> dict[str, Any]:
+    """Convert a Neo4j Record to a plain Python dictionary.
+
+    Args:
+        record: Neo4j Record object
+
+    Returns:
+        Plain Python dictionary with converted types
+    """
+    return {key: _convert_value(value) for key, value in record.items()}
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert Neo4j types to plain Python types.
+
+    Args:
+        value: Value from Neo4j
+
+    Returns:
+        Converted Python value
+    """
+    handler = _CONVERTERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # Unknown types: check against the concrete graph types - cheaper than
+    # hasattr's AttributeError-catching probe, especially on misses
+    if isinstance(value, Node):
+        result = {"_type": "node", "_labels": list(value.labels)}
+        result.update(dict(value))
+        return result
+    elif isinstance(value, Relationship):
+        result = {
+            "_type": "relationship",
+            "_relationshipType": value.type,
+        }
+        result.update(dict(value))
+        return result
+    else:
+        return value
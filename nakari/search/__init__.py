@@ -6,7 +6,7 @@ Supports Serper.dev with the ability to add other providers (Tavily, SerpAPI, et
 
 from .client import SearchClient, create_serper_client
 from .providers import SearchProvider, SerperProvider
-from .types import SearchOptions, SearchResponse, SearchResult, SearchType
+from .types import SearchOptions, SearchResponse, SearchResult, SearchResultBatch, SearchType
 from .errors import SearchError, SearchAuthError, SearchRateLimitError
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     "SearchOptions",
     "SearchResponse",
     "SearchResult",
+    "SearchResultBatch",
     "SearchType",
     "SearchError",
     "SearchAuthError",
@@ -45,22 +45,21 @@ class SearchClient:
         Returns:
             SearchResponse with news results
         """
-        opts = SearchOptions(type="news") if not options else SearchOptions(
-            type="news",
-            num_results=options.num_results,
-            language=options.language,
-            region=options.region,
-            timeout=options.timeout,
-        )
+        # _replace() carries every field over, so new SearchOptions fields
+        # won't be silently dropped here
+        opts = SearchOptions(type="news") if options is None else options._replace(type="news")
         return await self._provider.search(query, opts)
 
     async def verify_connectivity(self) -> None:
         """Verify connectivity to the search provider.
 
+        Delegates to the provider's lightweight check instead of issuing
+        a billable search.
+
         Raises:
             SearchError: If connection cannot be established
         """
-        await self._provider.search("test")
+        await self._provider.verify_connectivity()
 
 
 def create_serper_client(
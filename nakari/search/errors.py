@@ -2,7 +2,13 @@
 
 
 class SearchError(Exception):
-    """Base exception for search-related errors."""
+    """Base exception for search-related errors.
+
+    Slotted: these are raised on hot error paths (rate limits, timeouts),
+    and declared attributes resolve through slot descriptors.
+    """
+
+    __slots__ = ("code", "context")
 
     def __init__(self, message: str, code: str = "SEARCH_ERROR") -> None:
         """Initialize the search error.
@@ -13,17 +19,19 @@ class SearchError(Exception):
         """
         super().__init__(message)
         self.code = code
-        self.context: dict | None = None
+        self.context: dict[str, object] | None = None
 
     def with_context(self, **kwargs: object) -> "SearchError":
         """Add context to the error."""
-        self.context = kwargs  # type: ignore[assignment]
+        self.context = kwargs
         return self
 
 
 class SearchAuthError(SearchError):
     """Authentication or authorization error (401/403)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed") -> None:
         super().__init__(message, code="AUTH_ERROR")
 
@@ -31,5 +39,7 @@ class SearchAuthError(SearchError):
 class SearchRateLimitError(SearchError):
     """Rate limit error (429)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Rate limit exceeded") -> None:
         super().__init__(message, code="RATE_LIMIT_ERROR")
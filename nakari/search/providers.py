@@ -1,10 +1,45 @@
 """Search provider implementations."""
 
 import httpx
-from typing import Any
+import orjson
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .errors import SearchAuthError, SearchError, SearchRateLimitError
-from .types import SearchOptions, SearchResponse, SearchResponse as SearchResult, SearchType
+from .types import SearchOptions, SearchResponse, SearchResult, SearchType, _build_result
+
+# Endpoint and result key per search type, shared across all requests
+_ENDPOINTS: Mapping[SearchType, str] = MappingProxyType({
+    "search": "/search",
+    "news": "/news",
+    "images": "/images",
+    "videos": "/videos",
+})
+
+_RESULT_KEYS: Mapping[SearchType, str] = MappingProxyType({
+    "search": "organic",
+    "news": "news",
+    "images": "images",
+    "videos": "videos",
+})
+
+# Endpoint paths pre-parsed to httpx.URL once, so per-request URL parsing
+# and merging stays off the hot path
+_ENDPOINT_URLS: Mapping[SearchType, httpx.URL] = MappingProxyType(
+    {search_type: httpx.URL(path) for search_type, path in _ENDPOINTS.items()}
+)
+
+# How much of an upstream error body to include in exception messages
+_ERROR_BODY_LIMIT: int = 512
+
+
+def _error_body(response: httpx.Response) -> str:
+    """Return a truncated error body for an exception message.
+
+    Decodes only the first bytes of the body, so multi-KB upstream HTML
+    error pages never get fully materialized.
+    """
+    return response.content[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
 
 
 class SearchProvider:
@@ -32,6 +67,14 @@ class SearchProvider:
         """
         raise NotImplementedError
 
+    async def verify_connectivity(self) -> None:
+        """Verify connectivity to the provider.
+
+        Raises:
+            SearchError: If connection cannot be established
+        """
+        raise NotImplementedError
+
 
 class SerperProvider(SearchProvider):
     """Serper.dev search provider implementation.
@@ -57,7 +100,24 @@ class SerperProvider(SearchProvider):
         self._api_key = api_key
         self._base_url = base_url or self.DEFAULT_BASE_URL
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        # HTTP/2 with pinned keep-alive connections: after the first request
+        # Serper calls skip the TCP/TLS handshake and parallel searches
+        # multiplex instead of head-of-line blocking. Auth headers are baked
+        # in so no per-request header dict is allocated.
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=10,
+                max_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            headers={
+                "X-API-KEY": api_key,
+                "Content-Type": "application/json",
+            },
+            base_url=self._base_url,
+        )
 
     @property
     def name(self) -> str:
@@ -83,14 +143,9 @@ class SerperProvider(SearchProvider):
         """
         opts = options or SearchOptions()
 
-        # Determine endpoint based on search type
-        endpoints: dict[SearchType, str] = {
-            "search": "/search",
-            "news": "/news",
-            "images": "/images",
-            "videos": "/videos",
-        }
-        endpoint = endpoints.get(opts.type, "/search")
+        # Determine endpoint based on search type; SearchOptions validated
+        # the type at construction, so direct indexing cannot miss
+        endpoint = _ENDPOINT_URLS[opts.type]
 
         # Build request payload
         payload: dict[str, Any] = {"q": query}
@@ -101,35 +156,32 @@ class SerperProvider(SearchProvider):
         if opts.region:
             payload["gl"] = opts.region
 
-        headers = {
-            "X-API-KEY": self._api_key,
-            "Content-Type": "application/json",
-        }
-
-        url = f"{self._base_url}{endpoint}"
-
         try:
-            response = await self._client.post(url, json=payload, headers=headers)
+            # Encode the body with orjson instead of httpx's stdlib json path;
+            # the Content-Type header is already baked into the client
+            response = await self._client.post(endpoint, content=orjson.dumps(payload))
 
             # Handle error responses
             if response.status_code in (401, 403):
                 raise SearchAuthError(
-                    f"Authentication failed: {response.text}"
+                    f"Authentication failed: {_error_body(response)}"
                 ).with_context(status_code=response.status_code)
             elif response.status_code == 429:
                 raise SearchRateLimitError(
-                    f"Rate limit exceeded: {response.text}"
+                    f"Rate limit exceeded: {_error_body(response)}"
                 ).with_context(status_code=response.status_code)
             elif response.status_code >= 400:
                 raise SearchError(
-                    f"Search failed: {response.text}",
+                    f"Search failed: {_error_body(response)}",
                     code="HTTP_ERROR",
                 ).with_context(status_code=response.status_code)
 
-            data = response.json()
+            # Parse the raw response bytes with orjson - faster than stdlib
+            # json.loads and skips the UTF-8 decode pass
+            data = orjson.loads(response.content)
 
             # Convert to SearchResponse
-            results = self._convert_response(data, opts.type)
+            results = self._convert_results(data, opts.type)
             return SearchResponse(
                 results=results,
                 total_results=data.get("searchInformation", {}).get(
@@ -153,49 +205,76 @@ class SerperProvider(SearchProvider):
                 f"Unexpected error: {e!s}", code="UNKNOWN_ERROR"
             ).with_context(error=str(e))
 
-    def _convert_response(
-        self, data: dict[str, Any], search_type: SearchType
-    ) -> list[dict[str, Any]]:
-        """Convert Serper API response to standardized results.
+    def _convert_results(
+        self,
+        data: dict[str, Any],
+        search_type: SearchType,
+        _build=_build_result,
+    ) -> tuple[SearchResult, ...]:
+        """Convert a Serper API response straight to SearchResult objects.
+
+        Fields are bound directly from the raw payload with no
+        intermediate standardized dictionary per result - the decoded
+        payload is the only dict the parse ever materializes.
 
         Args:
             data: Raw API response data
             search_type: Type of search performed
 
         Returns:
-            List of standardized result dictionaries
+            Tuple of SearchResult objects
         """
-        results: list[dict[str, Any]] = []
-
-        # Different result keys based on search type
-        result_keys: dict[SearchType, str] = {
-            "search": "organic",
-            "news": "news",
-            "images": "images",
-            "videos": "videos",
-        }
-        key = result_keys.get(search_type, "organic")
-        raw_results = data.get(key, [])
+        # Different result keys based on search type (validated upstream)
+        key = _RESULT_KEYS[search_type]
+        raw_results = data.get(key, ())
 
+        results: list[SearchResult] = []
+        append = results.append
         for item in raw_results:
-            result: dict[str, Any] = {
-                "title": item.get("title", ""),
-                "link": item.get("link", ""),
-                "snippet": item.get("snippet", ""),
-            }
+            get = item.get
 
-            # Add type-specific fields
+            # Type-specific fields
+            date = site_name = thumbnail_url = None
             if search_type == "news":
-                result["date"] = item.get("date")
-                result["siteName"] = item.get("source")
+                date = get("date")
+                site_name = get("source")
             elif search_type == "images":
-                result["thumbnailUrl"] = item.get("imageUrl")
+                thumbnail_url = get("imageUrl")
             elif search_type == "videos":
-                result["thumbnailUrl"] = item.get("thumbnail")
+                thumbnail_url = get("thumbnail")
+
+            append(
+                _build(
+                    get("title", ""),
+                    get("link", ""),
+                    get("snippet", ""),
+                    date,
+                    thumbnail_url,
+                    site_name,
+                )
+            )
+
+        return tuple(results)
 
-            results.append(result)
+    async def verify_connectivity(self) -> None:
+        """Verify connectivity to Serper without consuming API quota.
 
-        return results
+        Issues a HEAD request: any HTTP response proves DNS/TCP/TLS work,
+        so only transport failures raise.
+
+        Raises:
+            SearchError: If connection cannot be established
+        """
+        try:
+            await self._client.head("/search")
+        except httpx.TimeoutException:
+            raise SearchError("Request timed out", code="TIMEOUT_ERROR").with_context(
+                timeout=self._timeout
+            )
+        except httpx.RequestError as e:
+            raise SearchError(
+                f"Request failed: {e!s}", code="REQUEST_ERROR"
+            ).with_context(error=str(e))
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -1,13 +1,36 @@
 """Type definitions for the search module."""
 
-from dataclasses import dataclass
-from typing import Literal
+import orjson
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from operator import itemgetter
+from sys import intern
+from types import MappingProxyType
+from typing import Literal, NamedTuple
 
 
 SearchType = Literal["search", "news", "images", "videos"]
 
+# Runtime counterpart of the SearchType Literal: one O(1) frozenset probe
+# at SearchOptions construction, so downstream code never re-validates
+_VALID_SEARCH_TYPES = frozenset(("search", "news", "images", "videos"))
 
-@dataclass(frozen=True)
+# Shared read-only empty metadata: every response without metadata points
+# at this one object, so consumers call .get unconditionally instead of
+# branching on None and the common case allocates nothing
+_EMPTY_METADATA: Mapping[str, object] = MappingProxyType({})
+
+# Bound once at module level: the frozen-dataclass __init__ routes every
+# assignment through object.__setattr__ anyway, so calling these directly
+# skips the generated __init__'s argument handling without losing anything
+_new = object.__new__
+_set = object.__setattr__
+
+
+# slots=True throughout: a response carries one instance per result, so
+# dropping the per-instance __dict__ cuts memory roughly in half and routes
+# attribute access through slot descriptors
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -17,47 +40,406 @@ class SearchResult:
     date: str | None = None
     thumbnail_url: str | None = None
     site_name: str | None = None
+    # Slot for the memoized repr string; not part of the public surface
+    _repr_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Instances are frozen, so the repr is invariant: format it on first
+    # use and hand back the cached string on every later logging/debug call
+    def __repr__(self) -> str:
+        cached = self._repr_cache
+        if cached is None:
+            cached = (
+                f"SearchResult(title={self.title!r}, link={self.link!r}, "
+                f"snippet={self.snippet!r}, date={self.date!r}, "
+                f"thumbnail_url={self.thumbnail_url!r}, "
+                f"site_name={self.site_name!r})"
+            )
+            _set(self, "_repr_cache", cached)
+        return cached
+
+    # The link identifies a result; hashing and comparing only it makes
+    # set/dict dedup of merged result pages one hash probe plus a single
+    # string compare, instead of the generated six-field comparison
+    def __hash__(self) -> int:
+        return hash(self.link)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SearchResult):
+            return self.link == other.link
+        return NotImplemented
 
     @classmethod
     def from_dict(cls, data: dict) -> "SearchResult":
         """Create a SearchResult from a dictionary."""
-        return cls(
-            title=data.get("title", ""),
-            link=data.get("link", ""),
-            snippet=data.get("snippet", ""),
-            date=data.get("date"),
-            thumbnail_url=data.get("thumbnailUrl"),
-            site_name=data.get("siteName"),
-        )
+        return _result_from_dict(data)
 
+    @classmethod
+    def _unsafe_new(
+        cls,
+        title: str,
+        link: str,
+        snippet: str,
+        date: str | None,
+        thumbnail_url: str | None,
+        site_name: str | None,
+    ) -> "SearchResult":
+        """Construct directly, bypassing the generated frozen __init__.
+
+        Every field must be supplied. Only the bulk parse path should use
+        this; everything else goes through the normal constructor.
+        """
+        result = _new(cls)
+        _set(result, "title", title)
+        _set(result, "link", link)
+        _set(result, "snippet", snippet)
+        _set(result, "date", date)
+        _set(result, "thumbnail_url", thumbnail_url)
+        _set(result, "site_name", site_name)
+        _set(result, "_repr_cache", None)
+        return result
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SearchResponse:
     """Response from a search query."""
 
-    results: list[SearchResult]
+    # An immutable sequence: the provider supplies an eagerly-built tuple,
+    # while from_dict supplies a lazily-parsed view over the raw dicts.
+    # Either way the response is never mutated and is safely shareable
+    # across coroutines.
+    results: Sequence[SearchResult] = ()
     total_results: int | None = None
     query: str = ""
-    metadata: dict | None = None
+    # default_factory because dataclasses rejects an unhashable default;
+    # the factory still hands every instance the same shared sentinel
+    metadata: Mapping[str, object] = field(default_factory=lambda: _EMPTY_METADATA)
+    # Original payload kept by from_dict so to_dict round-trips are a
+    # direct return instead of a recursive re-serialization
+    _raw: dict | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict) -> "SearchResponse":
         """Create a SearchResponse from a dictionary."""
-        results = [SearchResult.from_dict(r) for r in data.get("results", [])]
+        return _response_from_dict(data)
+
+    @classmethod
+    def from_json(cls, buf: bytes | str) -> "SearchResponse":
+        """Create a SearchResponse straight from JSON bytes.
+
+        orjson decodes the payload in C; the decoded dict then feeds the
+        same lazy builder as from_dict, so results bind per access and
+        the payload doubles as the cached to_dict form. Callers holding
+        raw response bytes should come here rather than decoding first.
+        """
+        return _response_from_dict(orjson.loads(buf))
+
+    def to_dict(self) -> dict:
+        """Return the response as a dictionary.
+
+        Responses built by from_dict hand back the original payload in
+        O(1); directly-constructed responses serialize their fields into
+        the same wire shape from_dict accepts, so the output always
+        round-trips.
+        """
+        if self._raw is not None:
+            return self._raw
+        return {
+            "results": [
+                {
+                    "title": r.title,
+                    "link": r.link,
+                    "snippet": r.snippet,
+                    "date": r.date,
+                    "thumbnailUrl": r.thumbnail_url,
+                    "siteName": r.site_name,
+                }
+                for r in self.results
+            ],
+            "totalResults": self.total_results,
+            "query": self.query,
+            "metadata": self.metadata or None,
+        }
+
+    def as_batch(self) -> "SearchResultBatch":
+        """Return a column-oriented view of the results.
+
+        Built on demand for bulk pipelines; per-result consumers keep
+        using the results tuple.
+        """
+        results = self.results
+        return SearchResultBatch(
+            titles=tuple(r.title for r in results),
+            links=tuple(r.link for r in results),
+            snippets=tuple(r.snippet for r in results),
+            dates=tuple(r.date for r in results),
+            thumbnail_urls=tuple(r.thumbnail_url for r in results),
+            site_names=tuple(r.site_name for r in results),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResultBatch:
+    """Column-oriented (structure-of-arrays) view of a result page.
+
+    Bulk consumers that scan a single field across every result - links
+    for dedup, snippets for embedding - walk one flat tuple instead of
+    dereferencing a SearchResult object per element. For very large
+    aggregated pages this is also the cheap storage form: six tuples of
+    string pointers per page instead of one object per row, with rows
+    materialized individually only when asked for.
+    """
+
+    titles: tuple[str, ...] = ()
+    links: tuple[str, ...] = ()
+    snippets: tuple[str, ...] = ()
+    dates: tuple[str | None, ...] = ()
+    thumbnail_urls: tuple[str | None, ...] = ()
+    site_names: tuple[str | None, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def __getitem__(self, index: int) -> "SearchResult":
+        """Materialize a single row as a SearchResult on demand.
+
+        Goes through the shared result builder, so repeated rows come
+        out of the parse cache rather than being rebuilt.
+        """
+        return _build_result(
+            self.titles[index],
+            self.links[index],
+            self.snippets[index],
+            self.dates[index],
+            self.thumbnail_urls[index],
+            self.site_names[index],
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SearchResultBatch":
+        """Build the six columns from a response dictionary in one pass."""
+        titles: list[str] = []
+        links: list[str] = []
+        snippets: list[str] = []
+        dates: list[str | None] = []
+        thumbnail_urls: list[str | None] = []
+        site_names: list[str | None] = []
+        for item in data.get("results", ()):
+            get = item.get
+            titles.append(get("title", ""))
+            links.append(get("link", ""))
+            snippets.append(get("snippet", ""))
+            dates.append(get("date"))
+            thumbnail_urls.append(get("thumbnailUrl"))
+            site_names.append(get("siteName"))
         return cls(
-            results=results,
-            total_results=data.get("totalResults"),
-            query=data.get("query", ""),
-            metadata=data.get("metadata"),
+            titles=tuple(titles),
+            links=tuple(links),
+            snippets=tuple(snippets),
+            dates=tuple(dates),
+            thumbnail_urls=tuple(thumbnail_urls),
+            site_names=tuple(site_names),
         )
 
 
-@dataclass(frozen=True)
-class SearchOptions:
-    """Options for search queries."""
+# Repeated and refreshed queries return the same top-ranked entries over and
+# over; memoizing on (title, link) turns a repeat parse into one dict probe.
+# Bounded so long-running sessions can't grow it without limit - once full,
+# new entries just aren't cached.
+_RESULT_CACHE_MAX: int = 4096
+_result_cache: dict[tuple[str, str], "SearchResult"] = {}
+
+# One C-level call fetching all three required fields, replacing three
+# data.get method calls on the hot path
+_required_fields = itemgetter("title", "link", "snippet")
 
+
+# Deserialization lives in module-level functions rather than the classmethod
+# bodies: bulk parsing calls plain functions with simple positional
+# signatures, and this is also the shape an optional compiled extension for
+# this module would declare, should one ever be worth shipping
+def _build_result(
+    title: str,
+    link: str,
+    snippet: str,
+    date: str | None,
+    thumbnail_url: str | None,
+    site_name: str | None,
+    _cache=_result_cache,
+    _intern=intern,
+    _unsafe_new=SearchResult._unsafe_new,
+) -> SearchResult:
+    """Build (or reuse from cache) a SearchResult from extracted fields.
+
+    Callers that already hold the individual fields - the Serper provider
+    walking a raw API payload - come here directly, skipping the
+    intermediate standardized dictionary entirely. Collaborators arrive
+    as pre-bound defaults so the body resolves names locally.
+    """
+    key = (title, link)
+    result = _cache.get(key)
+    # Reuse only genuinely identical inputs: the same link can arrive with
+    # a different snippet (refresh) or different type-specific fields
+    # (news vs web), and custom __eq__ compares links alone, so check the
+    # remaining fields explicitly before trusting the hit
+    if (
+        result is not None
+        and result.snippet == snippet
+        and result.date == date
+        and result.thumbnail_url == thumbnail_url
+        and result.site_name == site_name
+    ):
+        return result
+
+    # Intern the low-cardinality fields: across a page, site_name repeats
+    # heavily and date buckets into a handful of values, so N copies
+    # collapse to one shared string and == becomes a pointer check.
+    # title/snippet are near-unique, so interning them would only grow the
+    # interpreter's intern table.
+    result = _unsafe_new(
+        title,
+        link,
+        snippet,
+        _intern(date) if date else None,
+        thumbnail_url,
+        _intern(site_name) if site_name else None,
+    )
+    # Replacing an existing key keeps refreshed entries current even when
+    # the cache is full; only brand-new keys are subject to the cap
+    if key in _cache or len(_cache) < _RESULT_CACHE_MAX:
+        _cache[key] = result
+    return result
+
+
+def _result_from_dict(
+    data: dict,
+    _required=_required_fields,
+    _build=_build_result,
+) -> SearchResult:
+    """Build a SearchResult from a standardized result dictionary.
+
+    The result schema is fixed, so this is the fully specialized form of
+    the parse: its collaborators arrive as pre-bound defaults and every
+    name in the body resolves as a local, with no global lookups left on
+    the per-result path.
+    """
+    # Bind data.get to a local once - attribute lookups become plain
+    # calls, and positional args skip kwarg binding in __init__
+    get = data.get
+    # Well-formed inputs always supply the required fields, so the
+    # itemgetter fast path wins and the defaulting fallback stays cold
+    try:
+        title, link, snippet = _required(data)
+    except KeyError:
+        title = get("title", "")
+        link = get("link", "")
+        snippet = get("snippet", "")
+
+    return _build(
+        title, link, snippet, get("date"), get("thumbnailUrl"), get("siteName")
+    )
+
+
+class _LazyResults(Sequence):
+    """Sequence view that parses raw result dictionaries on first access.
+
+    Callers that only read total_results or the first few entries never
+    pay for parsing the rest of the page; each index is parsed at most
+    once. Full iteration costs the same as eager parsing, just spread
+    over the walk.
+    """
+
+    __slots__ = ("_raw", "_parsed")
+
+    def __init__(self, raw: Sequence[dict]) -> None:
+        self._raw = raw
+        self._parsed: list[SearchResult | None] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index, _parse=_result_from_dict):
+        if isinstance(index, slice):
+            return tuple(
+                self[i] for i in range(*index.indices(len(self._raw)))
+            )
+        item = self._parsed[index]
+        if item is None:
+            item = self._parsed[index] = _parse(self._raw[index])
+        return item
+
+    # Compare by materialized contents so a lazy view equals any sequence
+    # with the same results - two from_dict responses on identical payloads
+    # compare equal, as does a provider-built response with tuple results
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_LazyResults, tuple, list)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    # Defining __eq__ suppresses the default hash; frozen SearchResponse
+    # hashes its fields, so stay hashable by the same contents
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+def _response_from_dict(data: dict) -> SearchResponse:
+    """Build a SearchResponse from a response dictionary."""
+    # Results parse lazily: the raw dicts are kept and converted per index
+    # on demand, so "peek at the top hit" reads parse one entry, not 100
+    return SearchResponse(
+        results=_LazyResults(data.get("results", ())),
+        total_results=data.get("totalResults"),
+        query=data.get("query", ""),
+        metadata=data.get("metadata") or _EMPTY_METADATA,
+        _raw=data,
+    )
+
+
+class _SearchOptionsBase(NamedTuple):
     num_results: int | None = None
     type: SearchType = "search"
     language: str | None = None
     region: str | None = None
     timeout: int | None = None
+
+
+class SearchOptions(_SearchOptionsBase):
+    """Options for search queries.
+
+    A NamedTuple rather than a dataclass: options are a small immutable
+    bag created on every search call, and tuple construction is C-level
+    with no per-instance dict or generated __init__ dispatch.
+
+    The search type is checked once here against _VALID_SEARCH_TYPES
+    (NamedTuple bodies cannot override __new__, hence the base class), so
+    consumers can index type-keyed tables directly instead of
+    re-validating per call.
+
+    Raises:
+        ValueError: If type is not a valid SearchType
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        num_results: int | None = None,
+        type: SearchType = "search",
+        language: str | None = None,
+        region: str | None = None,
+        timeout: int | None = None,
+    ) -> "SearchOptions":
+        if type not in _VALID_SEARCH_TYPES:
+            raise ValueError(f"Invalid search type: {type!r}")
+        return super().__new__(cls, num_results, type, language, region, timeout)
+
+    # The generated _replace/_make build through tuple.__new__ and would
+    # bypass validation; route them through the checked constructor so the
+    # invariant holds for every way an instance can be produced
+    def _replace(self, **kwargs: object) -> "SearchOptions":
+        return SearchOptions(*super()._replace(**kwargs))
+
+    @classmethod
+    def _make(cls, iterable) -> "SearchOptions":
+        return cls(*iterable)